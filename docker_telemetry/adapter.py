@@ -1,6 +1,7 @@
+from simulation.domain.base_task import TaskId
 from simulation.domain.robot_state import RobotId
 from simulation.domain.simulation_state import SimulationState
-from simulation.domain.step_outcome import StepOutcome
+from simulation.domain.step_outcome import IgnoreReason, StepOutcome
 from simulation.domain.task import WorkTask
 from docker_telemetry.telemetry import RobotAction, RobotTelemetry
 
@@ -10,22 +11,52 @@ def build_telemetry(
     state: SimulationState,
     outcome: StepOutcome,
 ) -> RobotTelemetry:
+    return _build(robot_id, state, _TickIndex(state, outcome))
+
+
+def build_all_telemetry(
+    state: SimulationState,
+    outcome: StepOutcome,
+) -> dict[RobotId, RobotTelemetry]:
+    """Build telemetry for every robot in `state`.
+
+    Groups assignments and outcome entries by robot once per tick, instead
+    of rescanning them for each robot as repeated `build_telemetry` calls do.
+    """
+    index = _TickIndex(state, outcome)
+    return {robot_id: _build(robot_id, state, index) for robot_id in state.robot_states}
+
+
+class _TickIndex:
+    """Per-robot views of one tick's assignments and outcome."""
+
+    def __init__(self, state: SimulationState, outcome: StepOutcome) -> None:
+        self.moved_ids = {r for r, _ in outcome.moved}
+        self.worked_ids = {r for r, _ in outcome.worked}
+        self.stuck_ids = set(outcome.robots_stuck)
+
+        self.task_ids: dict[RobotId, list[TaskId]] = {}
+        for a in state.assignments:
+            self.task_ids.setdefault(a.robot_id, []).append(a.task_id)
+
+        self.ignore_reasons: dict[RobotId, list[IgnoreReason]] = {}
+        for assignment, reason in outcome.assignments_ignored:
+            self.ignore_reasons.setdefault(assignment.robot_id, []).append(reason)
+
+
+def _build(robot_id: RobotId, state: SimulationState, index: _TickIndex) -> RobotTelemetry:
     robot_state = state.robot_states[robot_id]
 
-    moved_ids  = {r for r, _ in outcome.moved}
-    worked_ids = {r for r, _ in outcome.worked}
-    if robot_id in outcome.robots_stuck:
+    if robot_id in index.stuck_ids:
         action = RobotAction.STUCK
-    elif robot_id in worked_ids:
+    elif robot_id in index.worked_ids:
         action = RobotAction.WORKED
-    elif robot_id in moved_ids:
+    elif robot_id in index.moved_ids:
         action = RobotAction.MOVED
     else:
         action = RobotAction.IDLE
 
-    assigned_task_ids = tuple(
-        a.task_id for a in state.assignments if a.robot_id == robot_id
-    )
+    assigned_task_ids = tuple(index.task_ids.get(robot_id, ()))
 
     task_capabilities = frozenset(
         cap
@@ -44,11 +75,7 @@ def build_telemetry(
                 deadline_delta_ticks = task.deadline.tick - state.t_now.tick
             break
 
-    ignore_reasons = tuple(
-        reason
-        for assignment, reason in outcome.assignments_ignored
-        if assignment.robot_id == robot_id
-    )
+    ignore_reasons = tuple(index.ignore_reasons.get(robot_id, ()))
 
     return RobotTelemetry(
         tick=state.t_now,
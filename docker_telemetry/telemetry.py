@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
-from simulation.primitives.capability import Capability
+from simulation.primitives.capability import Capability, sorted_capability_values
 from simulation.primitives.position import Position
 from simulation.primitives.time import Time
 from simulation.domain.robot_state import RobotId
@@ -45,7 +45,7 @@ class RobotTelemetry:
             ),
             "action":               self.action.value,
             "assigned_task_ids":    [int(t) for t in self.assigned_task_ids],
-            "task_capabilities":    sorted(c.value for c in self.task_capabilities),
+            "task_capabilities":    list(sorted_capability_values(self.task_capabilities)),
             "task_complexity":      self.task_complexity,
             "deadline_delta_ticks": self.deadline_delta_ticks,
             "ignore_reasons":       [r.value for r in self.ignore_reasons],
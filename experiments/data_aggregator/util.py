@@ -5,15 +5,28 @@ Shared utilities for loading experiment results.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 EXPERIMENTS_DIR = Path(__file__).parent.parent
 
+_MAX_LOAD_WORKERS = 8
+
+
+def _load_result(results_path: Path) -> dict:
+    return json.loads(results_path.read_bytes())
+
 
 def collect_results(scenario: str) -> list[dict]:
+    results_paths = sorted((EXPERIMENTS_DIR / scenario).glob("*/runs/*/results.json"))
+
+    # File reads dominate for large result sets; overlap them on a thread pool.
+    # map() preserves input order, so results stay sorted by path.
+    with ThreadPoolExecutor(max_workers=_MAX_LOAD_WORKERS) as pool:
+        loaded = list(pool.map(_load_result, results_paths))
+
     results = []
-    for results_path in sorted((EXPERIMENTS_DIR / scenario).glob("*/runs/*/results.json")):
-        data = json.loads(results_path.read_text())
+    for results_path, data in zip(results_paths, loaded):
         if "metadata" not in data:
             print(f"  skipping {results_path} (no metadata)")
             continue
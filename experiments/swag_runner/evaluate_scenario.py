@@ -9,6 +9,7 @@ DESIRED_RUN_COUNT = 1
 def evaluate_scenario(scenario_name: str) -> None:
     all_runs = get_all_runs_for_scenario(scenario_name)
 
+    lines: list[str] = []
     for override in Override:
         runs = [r for r in all_runs if r.override_type == override]
         succeeded = []
@@ -20,9 +21,11 @@ def evaluate_scenario(scenario_name: str) -> None:
             else:
                 failed.append(r.model)
 
-        print(f"\n[{scenario_name} / {override.value}]")
-        print(f"  succeeded ({len(succeeded)}): {', '.join(succeeded) if succeeded else 'none'}")
-        print(f"  failed    ({len(failed)}): {', '.join(failed) if failed else 'none'}")
+        lines.append(f"\n[{scenario_name} / {override.value}]")
+        lines.append(f"  succeeded ({len(succeeded)}): {', '.join(succeeded) if succeeded else 'none'}")
+        lines.append(f"  failed    ({len(failed)}): {', '.join(failed) if failed else 'none'}")
+
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
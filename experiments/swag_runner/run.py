@@ -33,7 +33,7 @@ from simulation.domain.robot_state import RobotId
 from experiments.swag_runner.models import Run, Override
 from experiments.utils import EXPERIMENTS_DIR
 from docker_telemetry.service import DockerService, ContainerId
-from docker_telemetry.adapter import build_telemetry
+from docker_telemetry.adapter import build_all_telemetry
 
 MAX_TICKS = 100
 
@@ -179,32 +179,35 @@ def _run_loop(
     docker_service: DockerService | None = None,
     containers: dict[RobotId, ContainerId] | None = None,
 ) -> None:
-    def _invoke(prompt: str) -> None:
-        asyncio.run(agent.invoke(prompt, max_tool_calls=5))
-
-    time_to_tasks: dict[Time, list[SpawnTask]] = {}
-
-    for s in tasks_to_spawn:
-        time_to_tasks.setdefault(s.time_to_spawn, []).append(s)
-
-    for _ in range(MAX_TICKS):
-        tasks_to_spawn_this_tick: list[SpawnTask] = time_to_tasks.get(runner._t_now, [])
-        for spawn_task in tasks_to_spawn_this_tick:
-            store.add_task(spawn_task.task_to_spawn, spawn_task.task_state)
-
-        state, outcome = runner.step()
-
-        if docker_service is not None and containers is not None:
-            for robot_id in state.robot_states:
-                telemetry = build_telemetry(robot_id, state, outcome)
-                docker_service.write_log(
-                    containers[robot_id],
-                    json.dumps(telemetry.to_json_dict()),
-                )
-
-        should_reassign = outcome.tasks_spawned or outcome.tasks_completed or len(tasks_to_spawn_this_tick) > 0
-        if should_reassign:
-            _invoke("Tasks changed. Reassign robots as needed.")
+    # One event loop for the whole run: asyncio.run() per invoke would tear
+    # down the loop — and litellm's pooled HTTP connections with it — on every
+    # reassignment, paying a fresh TCP/TLS handshake each time.
+    with asyncio.Runner() as event_loop:
+        def _invoke(prompt: str) -> None:
+            event_loop.run(agent.invoke(prompt, max_tool_calls=5))
+
+        time_to_tasks: dict[Time, list[SpawnTask]] = {}
+
+        for s in tasks_to_spawn:
+            time_to_tasks.setdefault(s.time_to_spawn, []).append(s)
+
+        for _ in range(MAX_TICKS):
+            tasks_to_spawn_this_tick: list[SpawnTask] = time_to_tasks.get(runner._t_now, [])
+            for spawn_task in tasks_to_spawn_this_tick:
+                store.add_task(spawn_task.task_to_spawn, spawn_task.task_state)
+
+            state, outcome = runner.step()
+
+            if docker_service is not None and containers is not None:
+                for robot_id, telemetry in build_all_telemetry(state, outcome).items():
+                    docker_service.write_log(
+                        containers[robot_id],
+                        json.dumps(telemetry.to_json_dict()),
+                    )
+
+            should_reassign = outcome.tasks_spawned or outcome.tasks_completed or len(tasks_to_spawn_this_tick) > 0
+            if should_reassign:
+                _invoke("Tasks changed. Reassign robots as needed.")
 
 
 # ---------------------------------------------------------------------------
@@ -17,6 +17,11 @@ Usage
 
 `invoke` appends the message to the shared conversation history, runs the
 tool loop to completion, and returns the final text reply.
+
+History grows for the whole run by default. Pass `max_history_messages` to
+keep only the most recent turns, bounding the prompt size of each request.
+Pass `compact_state=True` to send get_state results as compact JSON rather
+than indented JSON. Both are opt-in so default runs keep the same prompt text.
 """
 
 from __future__ import annotations
@@ -36,6 +41,9 @@ from llm.tools import make_tools
 from simulation.engine_rewrite.services.base_assignment_service import BaseAssignmentService
 from simulation.engine_rewrite.services.base_simulation_store import BaseSimulationStore
 
+_READ_ONLY_TOOLS = frozenset({"get_state"})
+"""Tools whose result depends only on current state, not on their arguments."""
+
 
 class AssignmentAgent:
     def __init__(
@@ -46,18 +54,30 @@ class AssignmentAgent:
         system: str | None = None,
         api_base: str | None = None,
         api_key: str | None = None,
+        max_history_messages: int | None = None,
+        compact_state: bool = False,
     ) -> None:
+        if max_history_messages is not None and max_history_messages < 1:
+            raise ValueError(
+                f"max_history_messages must be at least 1 or None, got {max_history_messages}"
+            )
         self._model = model
-        self._system = system
+        self._system_message: dict | None = (
+            {"role": "system", "content": system} if system else None
+        )
         self._api_base = api_base
         self._api_key = api_key
-        self._tools, self._handlers = make_tools(store, assignment_service)
+        self._tools, self._handlers = make_tools(
+            store, assignment_service, compact_state=compact_state
+        )
         self._history: list[dict] = []
+        self._max_history_messages = max_history_messages
         self._records: list[AgentCallRecord] = []
 
     @traceable(run_type="chain", name="AssignmentAgent.invoke")
     async def invoke(self, message: str, max_tool_calls: int | None = None) -> tuple[str, int]:
         self._history.append({"role": "user", "content": message})
+        self._trim_history()
 
         tool_calls_made = 0
         tool_rounds = 0
@@ -70,8 +90,8 @@ class AssignmentAgent:
 
         while True:
             messages = self._history
-            if self._system:
-                messages = [{"role": "system", "content": self._system}] + self._history
+            if self._system_message is not None:
+                messages = [self._system_message, *self._history]
 
             response = await litellm.acompletion(
                 model=self._model,
@@ -98,16 +118,29 @@ class AssignmentAgent:
                 final_content = msg.content or ""
                 break
 
+            # Models often batch several get_state calls into one round. Their
+            # results are identical until something is written, so share them.
+            read_results: dict[str, str] = {}
             for tc in msg.tool_calls:
-                tool_call_counts[tc.function.name] = tool_call_counts.get(tc.function.name, 0) + 1
-                handler = self._handlers.get(tc.function.name)
-                if handler is None:
-                    result = f"Unknown tool: {tc.function.name}"
+                name = tc.function.name
+                tool_call_counts[name] = tool_call_counts.get(name, 0) + 1
+                handler = self._handlers.get(name)
+                if name in read_results:
+                    result = read_results[name]
+                elif handler is None:
+                    result = f"Unknown tool: {name}"
                 else:
                     try:
                         result = handler(json.loads(tc.function.arguments))
                     except Exception as exc:
                         result = str(exc)
+                    else:
+                        if name in _READ_ONLY_TOOLS:
+                            read_results[name] = result
+                # Any other call may have changed state — even one that raised
+                # part-way through — so later reads in this round must re-run.
+                if name not in _READ_ONLY_TOOLS:
+                    read_results.clear()
 
                 self._history.append({
                     "role": "tool",
@@ -129,5 +162,21 @@ class AssignmentAgent:
         ))
         return final_content, tokens_in + tokens_out
 
+    def _trim_history(self) -> None:
+        """Drop the oldest turns so history holds at most max_history_messages.
+
+        Cuts only at a user-message boundary so an assistant tool_calls message
+        is never separated from its tool results. The current turn is always kept.
+        """
+        if self._max_history_messages is None:
+            return
+        excess = len(self._history) - self._max_history_messages
+        if excess <= 0:
+            return
+        for i in range(excess, len(self._history)):
+            if self._history[i]["role"] == "user":
+                del self._history[:i]
+                return
+
     def get_analysis(self) -> AgentAnalysis:
         return AgentAnalysis.from_records(self._records)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentCallRecord:
     """Records the cost and performance of a single agent decision (one planning step).
 
@@ -3,7 +3,7 @@ llm/tools.py
 
 Tool definitions and handlers for LLM-based robot assignment.
 
-`make_tools(store, assignment_service)` returns:
+`make_tools(store, assignment_service, compact_state=False)` returns:
   - list[dict]              — OpenAI-format tool schemas to pass to litellm
   - dict[str, Callable]     — handler map keyed by tool name; each handler
                               takes the LLM's args dict and returns a string
@@ -25,6 +25,7 @@ from simulation.engine_rewrite.services.base_simulation_store import BaseSimulat
 from simulation.domain.assignment import Assignment
 from simulation.domain.robot_state import RobotId
 from simulation.domain.base_task import TaskId
+from simulation.primitives.capability import sorted_capability_names
 
 
 # ---------------------------------------------------------------------------
@@ -47,7 +48,7 @@ def _serialise_state(
             "id": robot_id,
             "position": {"x": state.position.x, "y": state.position.y},
             "battery": round(state.battery_level, 3),
-            "capabilities": sorted(c.name for c in robot.capabilities),
+            "capabilities": list(sorted_capability_names(robot.capabilities)),
         })
 
     tasks = []
@@ -57,7 +58,7 @@ def _serialise_state(
             "id": task_id,
             "priority": task.priority,
             "status": task_state.status.value if task_state.status else None,
-            "required_capabilities": sorted(c.name for c in task.required_capabilities),
+            "required_capabilities": list(sorted_capability_names(task.required_capabilities)),
         }
 
         if isinstance(task, SearchTask):
@@ -109,12 +110,17 @@ def _serialise_state(
 def make_tools(
     store: BaseSimulationStore,
     assignment_service: BaseAssignmentService,
+    compact_state: bool = False,
 ) -> tuple[list[dict], dict[str, Callable[[dict], str]]]:
     """
     Return (schemas, handlers) for the two assignment tools.
 
     schemas  — OpenAI-format tool dicts, pass directly to litellm
     handlers — dispatch by tool name: handlers[name](args) -> result_str
+
+    compact_state — serialise get_state without indentation, which cuts
+                    encode time and prompt tokens but changes the prompt
+                    text relative to the default indent=2 output
     """
 
     schemas = [
@@ -165,9 +171,13 @@ def make_tools(
         },
     ]
 
+    dumps_kwargs: dict = (
+        {"separators": (",", ":")} if compact_state else {"indent": 2}
+    )
+
     @traceable(run_type="tool", name="get_state")
     def handle_get_state(_args: dict) -> str:
-        return json.dumps(_serialise_state(store, assignment_service), indent=2)
+        return json.dumps(_serialise_state(store, assignment_service), **dumps_kwargs)
 
     @traceable(run_type="tool", name="write_assignments")
     def handle_write_assignments(args: dict) -> str:
@@ -1,4 +1,5 @@
 from simulation.algorithms.astar_pathfinding import astar_pathfind
+from simulation.algorithms.bidirectional_pathfinding import bidirectional_pathfind
 from simulation.algorithms.formation_planner import (
     is_formation_clear,
     plan_formation_move,
@@ -13,6 +14,7 @@ from simulation.algorithms.search_goal import compute_search_goal
 
 __all__ = [
     "astar_pathfind",
+    "bidirectional_pathfind",
     "is_formation_clear",
     "plan_formation_move",
     "plan_soft_formation_move",
@@ -4,11 +4,19 @@ A* pathfinding algorithm with 4-connectivity (cardinal directions only).
 Returns the next step on the shortest path from start to goal,
 avoiding obstacles. Robots always occupy integer grid cells and move
 one cell per tick in N/S/E/W directions only.
+
+Results are memoised per (obstacles, grid size, start, goal, occupied).
+The environment hands out the same obstacle frozenset until an obstacle
+is added, so the cache key changes exactly when the grid does. Within a
+tick the same query is commonly issued twice (search robots check that
+their waypoint is reachable, then path to it), and static scenarios
+repeat queries across ticks.
 """
 
 from __future__ import annotations
 
 import heapq
+from functools import lru_cache
 
 from simulation.domain.environment import Environment
 from simulation.primitives.position import Position
@@ -38,81 +46,156 @@ def astar_pathfind(
     """
     if start == goal:
         return goal
-
-    obstacle_cells: frozenset[tuple[int, int]] = frozenset(
-        (p.x, p.y) for p in environment.obstacles
-    ) | frozenset(
-        (p.x, p.y) for p in occupied if p != goal
+    return _first_step(
+        environment.obstacles, environment.width, environment.height, start, goal, occupied
     )
 
-    start_cell = (start.x, start.y)
-    goal_cell = (goal.x, goal.y)
 
-    if start_cell in obstacle_cells:
-        return None
+_PATH_CACHE_SIZE = 4096
 
-    width = environment.width
-    height = environment.height
+# Value written into the blocked grid for cells A* has already expanded.
+_CLOSED = 2
 
-    def h(cell: tuple[int, int]) -> int:
-        return abs(cell[0] - goal_cell[0]) + abs(cell[1] - goal_cell[1])
 
-    # Priority queue entries: (f, g, cell, first_step)
-    # first_step tracks which neighbor of start begins this path
-    open_heap: list[tuple[int, int, tuple[int, int], tuple[int, int]]] = []
-    came_first: dict[tuple[int, int], tuple[int, int]] = {}
-    g_score: dict[tuple[int, int], int] = {start_cell: 0}
+@lru_cache(maxsize=_PATH_CACHE_SIZE)
+def _first_step(
+    obstacles: frozenset[Position],
+    width: int,
+    height: int,
+    start: Position,
+    goal: Position,
+    occupied: frozenset[Position],
+) -> Position | None:
+    """A* search proper. Pure in its arguments, so safe to memoise.
 
-    for nx, ny in _neighbors(start_cell, width, height):
-        if (nx, ny) in obstacle_cells and (nx, ny) != goal_cell:
-            continue
-        if (nx, ny) == goal_cell:
-            return Position(nx, ny)
-        g = 1
-        f = g + h((nx, ny))
-        heapq.heappush(open_heap, (f, g, (nx, ny), (nx, ny)))
-        g_score[(nx, ny)] = g
-        came_first[(nx, ny)] = (nx, ny)
+    Cells are flat ints in column-major order (`x * height + y`). Comparing
+    two indices orders cells exactly like comparing `(x, y)` tuples, so heap
+    tie-breaking — and therefore the chosen path — matches a tuple-keyed search.
+    """
+    if not (0 <= start.x < width and 0 <= start.y < height):
+        return None
+    if not (0 <= goal.x < width and 0 <= goal.y < height):
+        return None
 
-    visited: set[tuple[int, int]] = {start_cell}
+    # Packed blocked grid: one byte per cell, non-zero = impassable.
+    blocked = bytearray(_obstacle_grid(obstacles, width, height))
+    for p in occupied:
+        if 0 <= p.x < width and 0 <= p.y < height:
+            blocked[p.x * height + p.y] = 1
 
-    while open_heap:
-        f, g, current, first_step = heapq.heappop(open_heap)
+    start_cell = start.x * height + start.y
+    goal_cell = goal.x * height + goal.y
+    goal_x, goal_y = goal.x, goal.y
 
-        if current in visited:
+    if blocked[start_cell]:
+        return None
+    blocked[goal_cell] = 0  # the goal is always enterable
+
+    h = _heuristic_table(goal_x, goal_y, width, height)
+    neighbors = _neighbor_table(width, height)
+
+    # Bucket queue: f -> heap of (g, cell, first_step).
+    # first_step tracks which neighbor of start begins this path. The entry
+    # that closes a cell is always its latest (lowest-g) push, so the popped
+    # first_step is the one to hand on to its neighbors.
+    # Manhattan distance is consistent and every move costs 1, so a push
+    # lands in the current bucket (f) or two above it (f + 2), never below.
+    # Popping the lowest non-empty bucket's heap therefore yields entries
+    # in exactly the (f, g, cell, first_step) order of a single heap.
+    buckets: dict[int, list[tuple[int, int, int]]] = {}
+    # Flat per-cell g-scores; every real score is below width * height.
+    g_score = [width * height] * (width * height)
+    g_score[start_cell] = 0
+
+    for n in neighbors[start_cell]:
+        if blocked[n]:
             continue
-        visited.add(current)
+        if n == goal_cell:
+            return Position(goal_x, goal_y)
+        g = 1
+        f = g + h[n]
+        heapq.heappush(buckets.setdefault(f, []), (g, n, n))
+        g_score[n] = g
 
-        if current == goal_cell:
-            return Position(first_step[0], first_step[1])
+    # Expanded cells are marked in `blocked` too (CLOSED), so one byte lookup
+    # answers both "already visited?" and "impassable?".
+    blocked[start_cell] = _CLOSED
 
-        for nx, ny in _neighbors(current, width, height):
-            if (nx, ny) in visited:
-                continue
-            if (nx, ny) in obstacle_cells and (nx, ny) != goal_cell:
+    while buckets:
+        f = min(buckets)
+        bucket = buckets[f]
+        while bucket:
+            g, current, first_step = heapq.heappop(bucket)
+
+            if blocked[current]:
                 continue
-            new_g = g + 1
-            if (nx, ny) not in g_score or new_g < g_score[(nx, ny)]:
-                g_score[(nx, ny)] = new_g
-                new_f = new_g + h((nx, ny))
-                step = came_first.get(current, first_step)
-                came_first[(nx, ny)] = step
-                heapq.heappush(open_heap, (new_f, new_g, (nx, ny), step))
+            blocked[current] = _CLOSED
+
+            for n in neighbors[current]:
+                if n == goal_cell:
+                    # Stopping at the goal's first discovery picks the same
+                    # path as popping it later: with a consistent heuristic
+                    # this g is already optimal, and later equal-g pushes are
+                    # rejected by the strict g_score check anyway.
+                    x, y = divmod(first_step, height)
+                    return Position(x, y)
+                if blocked[n]:
+                    continue
+                new_g = g + 1
+                if new_g < g_score[n]:
+                    g_score[n] = new_g
+                    new_f = new_g + h[n]
+                    heapq.heappush(buckets.setdefault(new_f, []), (new_g, n, first_step))
+        del buckets[f]
 
     return None
 
 
-def _neighbors(
-    cell: tuple[int, int],
-    width: int,
-    height: int,
-) -> list[tuple[int, int]]:
-    """Return valid 4-connected (cardinal) neighbors within bounds."""
-    cx, cy = cell
-    candidates = [
-        (cx + 1, cy),
-        (cx - 1, cy),
-        (cx,     cy + 1),
-        (cx,     cy - 1),
-    ]
-    return [(nx, ny) for nx, ny in candidates if 0 <= nx < width and 0 <= ny < height]
+@lru_cache(maxsize=8)
+def _obstacle_grid(obstacles: frozenset[Position], width: int, height: int) -> bytes:
+    """Static part of the blocked grid, shared by every search on the same map.
+
+    Obstacles only change when one is added, so across robots and ticks this
+    is built once and each search starts from a flat copy of it.
+    """
+    grid = bytearray(width * height)
+    for p in obstacles:
+        grid[p.x * height + p.y] = 1
+    return bytes(grid)
+
+
+@lru_cache(maxsize=64)
+def _heuristic_table(goal_x: int, goal_y: int, width: int, height: int) -> tuple[int, ...]:
+    """Manhattan distance to the goal for every cell, indexed like the grid.
+
+    Robots head for the same task or waypoint for many ticks in a row, so a
+    goal's table is reused far more often than it is built.
+    """
+    return tuple(
+        abs(x - goal_x) + abs(y - goal_y) for x in range(width) for y in range(height)
+    )
+
+
+@lru_cache(maxsize=8)
+def _neighbor_table(width: int, height: int) -> tuple[tuple[int, ...], ...]:
+    """In-bounds 4-connected (cardinal) neighbors of every cell.
+
+    Order is +x, -x, +y, -y, matching the original (x, y) neighbor order.
+    Built once per grid size so searches index it instead of allocating a
+    neighbor list per expansion.
+    """
+    table: list[tuple[int, ...]] = []
+    for x in range(width):
+        for y in range(height):
+            cell = x * height + y
+            neighbors: list[int] = []
+            if x + 1 < width:
+                neighbors.append(cell + height)
+            if x > 0:
+                neighbors.append(cell - height)
+            if y + 1 < height:
+                neighbors.append(cell + 1)
+            if y > 0:
+                neighbors.append(cell - 1)
+            table.append(tuple(neighbors))
+    return tuple(table)
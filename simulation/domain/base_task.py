@@ -12,11 +12,11 @@ TaskState depend on them, and both extend types defined in this module.
 from __future__ import annotations
 
 import dataclasses
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import NewType
 
-from simulation.primitives.capability import Capability
+from simulation.primitives.capability import Capability, capability_mask
 from simulation.primitives.time import Time
 
 
@@ -54,14 +54,23 @@ class BaseTask:
     Every task has an identity, a priority, capability requirements, and
     dependency edges. Type-specific fields (work time, spatial constraints,
     proximity threshold, etc.) live on concrete subclasses.
+
+    required_capability_mask is `required_capabilities` encoded as an int
+    bitmask, computed once at construction (see Robot.capability_mask).
     """
 
     id: TaskId
     priority: int
     required_capabilities: frozenset[Capability] = frozenset()
+    required_capability_mask: int = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "required_capability_mask", capability_mask(self.required_capabilities)
+        )
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BaseTaskState:
     """
     Immutable runtime state for all task types.
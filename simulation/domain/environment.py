@@ -8,7 +8,7 @@ Coordinate / indexing conventions:
 - `(0, 0)` is the **top-left** cell.
 - `x` indexes columns (increases to the right).
 - `y` indexes rows (increases downward).
-- Grid indexing: `grid[y][x]`.
+- Grid storage is a flat row-major list: cell `(x, y)` lives at `grid[y * width + x]`.
 
 Core invariant:
 - **No overlap**: at most one object may occupy a grid cell at a time.
@@ -16,7 +16,7 @@ Core invariant:
 from __future__ import annotations
 
 from types import MappingProxyType
-from typing import Mapping
+from typing import Iterable, Mapping
 
 from simulation.primitives.position import Position
 from simulation.domain.rescue_point import RescuePoint
@@ -42,11 +42,16 @@ class Environment:
     def __init__(self, width: int, height: int):
         self._width = width    # cols
         self._height = height  # rows
-        self._grid = [[None for _ in range(width)]
-                      for _ in range(height)]
+        self._grid: list[object | None] = [None] * (width * height)
         self._zones: dict[ZoneId, Zone] = {}
+        self._zone_by_cell: dict[Position, ZoneId] = {}
         self._obstacles: set[Position] = set()
+        self._obstacles_view: frozenset[Position] | None = frozenset()
         self._rescue_points: dict[TaskId, RescuePoint] = {}
+        # Flat indices of non-empty grid cells, and the cached `__repr__`
+        # background (invalidated by `add_zone`).
+        self._occupied_cells: list[int] = []
+        self._repr_background: list[str] | None = None
 
     @property
     def width(self) -> int:
@@ -72,27 +77,28 @@ class Environment:
         - If `str(obj)` fails for any reason, the cell renders as `UNKNOWN_OBJECT_STRING`
           (the literal `?`).
         """
-        rows: list[str] = []
-        for y in range(self._height):
-            row_chars: list[str] = []
-            for x in range(self._width):
-                obj = self._grid[y][x]
-                if obj is None:
-                    pos = Position(x, y)
-                    zone_id = self._get_zone_id_at(pos)
-                    if zone_id is not None:
-                        row_chars.append(str(zone_id) if zone_id < 10 else "+")
-                    else:
-                        row_chars.append("../world")
-                    continue
-                try:
-                    s = str(obj)
-                    row_chars.append((s[0] if s else self.UNKNOWN_OBJECT_STRING))
-                except Exception:
-                    row_chars.append(self.UNKNOWN_OBJECT_STRING)
-            rows.append("".join(row_chars))
-
-        grid_str = "\n".join(rows)
+        # The background (`.` plus zone IDs) only changes in add_zone, so it
+        # is cached; each call copies it and overlays just the occupied cells.
+        if self._repr_background is None:
+            background = ["."] * (self._width * self._height)
+            for zone_id, zone in self._zones.items():
+                zone_char = str(zone_id) if zone_id < 10 else "+"
+                for pos in zone.cells:
+                    background[pos.y * self._width + pos.x] = zone_char
+            self._repr_background = background
+
+        cells = self._repr_background.copy()
+        for i in self._occupied_cells:
+            try:
+                s = str(self._grid[i])
+                cells[i] = s[0] if s else self.UNKNOWN_OBJECT_STRING
+            except Exception:
+                cells[i] = self.UNKNOWN_OBJECT_STRING
+
+        width = self._width
+        grid_str = "\n".join(
+            "".join(cells[y * width:(y + 1) * width]) for y in range(self._height)
+        )
         return f"Environment(width={self._width}, height={self._height})\n{grid_str}"
 
     def get_at(self, pos: Position) -> object | None:
@@ -104,7 +110,7 @@ class Environment:
         """
         if not self._position_in_bounds(pos):
             raise IndexError(f"Invalid position {pos}")
-        return self._grid[pos.y][pos.x]
+        return self._grid[pos.y * self._width + pos.x]
 
     def is_empty(self, pos: Position) -> bool:
         """
@@ -127,14 +133,24 @@ class Environment:
         """
         if not self._position_in_bounds(pos):
             raise IndexError(f"Invalid position {pos}")
-        if self._grid[pos.y][pos.x] is not None:
+        index = pos.y * self._width + pos.x
+        if self._grid[index] is not None:
             raise ValueError("Position occupied")
-        self._grid[pos.y][pos.x] = obj
+        self._grid[index] = obj
+        self._occupied_cells.append(index)
 
     @property
     def obstacles(self) -> frozenset[Position]:
-        """Return the set of obstacle positions."""
-        return frozenset(self._obstacles)
+        """Return the set of obstacle positions.
+
+        The same frozenset is returned until an obstacle is added, so callers
+        may use its identity as a cheap grid-version key. It is rebuilt lazily
+        on the first read after a change, so adding many obstacles in a row
+        costs one copy, not one per obstacle.
+        """
+        if self._obstacles_view is None:
+            self._obstacles_view = frozenset(self._obstacles)
+        return self._obstacles_view
 
     def add_obstacle(self, pos: Position) -> None:
         """
@@ -148,6 +164,34 @@ class Environment:
             return  # Already an obstacle here, no-op
         self.place(pos, Obstacle())
         self._obstacles.add(pos)
+        self._obstacles_view = None
+
+    def add_obstacles(self, positions: Iterable[Position]) -> None:
+        """
+        Add obstacles at all given positions.
+
+        Equivalent to calling `add_obstacle` for each position (existing
+        obstacles and repeats are skipped), but atomic: every position is
+        validated before any is placed.
+
+        Raises:
+            IndexError: If any position is out of bounds.
+            ValueError: If any position is occupied by a non-obstacle object.
+        """
+        new = set(positions) - self._obstacles
+        for pos in new:
+            if not self._position_in_bounds(pos):
+                raise IndexError(f"Invalid position {pos}")
+            if self._grid[pos.y * self._width + pos.x] is not None:
+                raise ValueError("Position occupied")
+        if not new:
+            return
+        for pos in new:
+            index = pos.y * self._width + pos.x
+            self._grid[index] = Obstacle()
+            self._occupied_cells.append(index)
+        self._obstacles |= new
+        self._obstacles_view = None
 
     def add_zone(self, zone: Zone) -> None:
         """
@@ -173,15 +217,21 @@ class Environment:
             if not self._position_in_bounds(pos):
                 raise IndexError(f"Zone position {pos} is out of bounds for zone id {zone.id}")
 
-        # Step 3: Validate zones do not overlap with existing zones
-        for existing_zone in self._zones.values():
-            if zone.cells & existing_zone.cells:
-                raise ValueError(
-                    f"Zone {zone.id} overlaps with existing zone {existing_zone.id}"
-                )
+        # Step 3: Validate zones do not overlap with existing zones.
+        # One probe of the cell index per new cell, instead of intersecting
+        # with every existing zone; report the earliest-added zone hit.
+        overlapping = {
+            self._zone_by_cell[pos] for pos in zone.cells if pos in self._zone_by_cell
+        }
+        if overlapping:
+            existing_id = next(zid for zid in self._zones if zid in overlapping)
+            raise ValueError(f"Zone {zone.id} overlaps with existing zone {existing_id}")
 
         # All validations passed - commit the zone
         self._zones[zone.id] = zone
+        for pos in zone.cells:
+            self._zone_by_cell[pos] = zone.id
+        self._repr_background = None
 
     def add_rescue_point(self, rp: RescuePoint) -> None:
         """
@@ -223,12 +273,13 @@ class Environment:
         """Return the Zone with the given ID, or None if not found."""
         return self._zones.get(zone_id)
 
-    def _get_zone_id_at(self, pos: Position) -> ZoneId | None:
-        """Return the zone ID containing `pos`, or None if not in any zone."""
-        for zone_id, zone in self._zones.items():
-            if zone.contains(pos):
-                return zone_id
-        return None
+    def zone_id_at(self, pos: Position) -> ZoneId | None:
+        """Return the zone ID containing `pos`, or None if not in any zone.
+
+        Backed by a cell -> zone index filled in `add_zone`, so this is a
+        single dict lookup regardless of how many zones exist.
+        """
+        return self._zone_by_cell.get(pos)
 
     def to_json_dict(self) -> dict:
         return {
@@ -19,10 +19,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from simulation.domain.base_task import BaseTask, BaseTaskState
+from simulation.primitives.capability import sorted_capability_values
 from simulation.primitives.position import Position
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveTaskState(BaseTaskState):
     """Runtime state tracking where a MoveTask currently is."""
 
@@ -51,7 +52,7 @@ class MoveTask(BaseTask):
             "type": "move_task",
             "id": int(self.id),
             "priority": self.priority,
-            "required_capabilities": sorted(c.value for c in self.required_capabilities),
+            "required_capabilities": list(sorted_capability_values(self.required_capabilities)),
             "destination": {"x": self.destination.x, "y": self.destination.y},
             "min_robots_required": self.min_robots_required,
             "min_distance": self.min_distance,
@@ -15,9 +15,9 @@ explicitly to make call sites self-describing.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from simulation.primitives.capability import Capability
+from simulation.primitives.capability import Capability, capability_mask, sorted_capability_values
 from simulation.primitives.position import Position
 from simulation.domain.robot_state import RobotId, RobotState
 
@@ -40,6 +40,8 @@ class Robot:
     battery_drain_per_unit_of_movement: battery lost per one-cell move.
     battery_drain_per_unit_of_work_execution: battery lost per one-tick work contribution.
     battery_drain_per_tick_idle: battery lost when neither moving nor working.
+    capability_mask: `capabilities` encoded as an int bitmask, computed once at
+        construction so feasibility checks are a single AND per tick.
     """
 
     id: RobotId
@@ -48,11 +50,15 @@ class Robot:
     battery_drain_per_unit_of_movement:       float = _DRAIN_MOVE_PER_TICK
     battery_drain_per_unit_of_work_execution: float = _DRAIN_WORK_PER_TICK
     battery_drain_per_tick_idle:              float = _DRAIN_IDLE_PER_TICK
+    capability_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "capability_mask", capability_mask(self.capabilities))
 
     def to_json_dict(self) -> dict:
         return {
             "id": int(self.id),
-            "capabilities": sorted(c.value for c in self.capabilities),
+            "capabilities": list(sorted_capability_values(self.capabilities)),
             "speed": self.speed,
             "battery_drain_per_unit_of_movement": self.battery_drain_per_unit_of_movement,
             "battery_drain_per_unit_of_work_execution": self.battery_drain_per_unit_of_work_execution,
@@ -20,7 +20,7 @@ RobotId = NewType("RobotId", int)
 """Opaque identifier for robots. Hashable and comparable."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RobotState:
     """
     Immutable runtime state for a robot within a single simulation run.
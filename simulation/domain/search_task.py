@@ -15,9 +15,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from simulation.domain.base_task import BaseTask, BaseTaskState, TaskId
+from simulation.primitives.capability import sorted_capability_values
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchTaskState(BaseTaskState):
     """
     Immutable runtime state for a SearchTask.
@@ -60,6 +61,6 @@ class SearchTask(BaseTask):
             "type": "search_task",
             "id": int(self.id),
             "priority": self.priority,
-            "required_capabilities": sorted(c.value for c in self.required_capabilities),
+            "required_capabilities": list(sorted_capability_values(self.required_capabilities)),
         }
 
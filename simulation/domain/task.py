@@ -19,7 +19,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from simulation.primitives.capability import Capability  # noqa: F401 (re-export via BaseTask)
+from simulation.primitives.capability import Capability, sorted_capability_values  # noqa: F401 (re-export via BaseTask)
 from simulation.primitives.position import Position
 from simulation.primitives.time import Time
 from simulation.primitives.zone import ZoneId
@@ -67,7 +67,7 @@ class WorkTask(BaseTask):
             "type": "work_task",
             "id": int(self.id),
             "priority": self.priority,
-            "required_capabilities": sorted(c.value for c in self.required_capabilities),
+            "required_capabilities": list(sorted_capability_values(self.required_capabilities)),
             "required_work_time": self.required_work_time.tick,
             "spatial_constraint": self.spatial_constraint.to_json_dict() if self.spatial_constraint else None,
             "deadline": self.deadline.tick if self.deadline else None,
@@ -26,7 +26,7 @@ from simulation.domain.base_task import (  # noqa: F401 (re-export)
 from simulation.primitives.time import Time
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskState(BaseTaskState):
     """
     Immutable runtime state for a work-accumulation Task.
@@ -108,33 +108,9 @@ class SimulationAnalysis:
         final_state = history[-1].state
         total_ticks = final_state.t_now.tick
 
-        # --- tasks completed / failed ---
+        # --- single pass over history: completions, utilization, ignores ---
         completed_ids: set[TaskId] = set()
         task_completion_tick: dict[TaskId, int] = {}
-        for tick_index, entry in enumerate(history):
-            completed_ids.update(entry.outcome.tasks_completed)
-            for task_id in entry.outcome.tasks_completed:
-                if task_id not in task_completion_tick:
-                    task_completion_tick[task_id] = tick_index
-
-        failed_ids: set[TaskId] = {
-            task_id
-            for task_id, ts in final_state.task_states.items()
-            if ts.status == TaskStatus.FAILED
-        }
-
-        makespan: int | None = None
-        if completed_ids:
-            completion_ticks = [
-                ts.completed_at.tick
-                for tid in completed_ids
-                if (ts := final_state.task_states.get(tid)) is not None
-                and ts.completed_at is not None
-            ]
-            if completion_ticks:
-                makespan = max(completion_ticks)
-
-        # --- robot utilization ---
         robot_ticks_working: dict[RobotId, int] = defaultdict(int)
         robot_ticks_moving: dict[RobotId, int] = defaultdict(int)
         robot_ticks_stuck: dict[RobotId, int] = defaultdict(int)
@@ -145,25 +121,34 @@ class SimulationAnalysis:
         assignment_ignores_by_reason: dict[IgnoreReason, int] = defaultdict(int)
 
         for tick_index, entry in enumerate(history):
-            robots_active_this_tick: set[RobotId] = set()
+            outcome = entry.outcome
 
-            for robot_id, _task_id in entry.outcome.worked:
+            for task_id in outcome.tasks_completed:
+                if task_id not in completed_ids:
+                    completed_ids.add(task_id)
+                    task_completion_tick[task_id] = tick_index
+
+            for robot_id, task_id in outcome.worked:
                 robot_ticks_working[robot_id] += 1
-                robots_active_this_tick.add(robot_id)
+                task_ticks_worked_by[task_id].add(tick_index)
 
-            for robot_id, _position in entry.outcome.moved:
+            for robot_id, _position in outcome.moved:
                 robot_ticks_moving[robot_id] += 1
-                robots_active_this_tick.add(robot_id)
 
-            for robot_id in entry.outcome.robots_stuck:
+            for robot_id in outcome.robots_stuck:
                 robot_ticks_stuck[robot_id] += 1
 
-            for robot_id, task_id in entry.outcome.worked:
-                task_ticks_worked_by[task_id].add(tick_index)
-
-            for assignment, reason in entry.outcome.assignments_ignored:
+            for _assignment, reason in outcome.assignments_ignored:
                 assignment_ignores_by_reason[reason] += 1
 
+        # --- tasks failed ---
+        failed_ids: set[TaskId] = {
+            task_id
+            for task_id, ts in final_state.task_states.items()
+            if ts.status == TaskStatus.FAILED
+        }
+
+        # --- robot utilization ---
         # idle = ticks where the robot appeared in neither worked nor moved
         robot_ticks_idle: dict[RobotId, int] = {}
         for robot_id in final_state.robot_states:
@@ -178,18 +163,18 @@ class SimulationAnalysis:
             for robot_id, rs in final_state.robot_states.items()
         }
 
-        # --- task progress ---
+        # --- makespan / task progress: one lookup per completed task ---
+        makespan: int | None = None
         task_ticks_to_complete: dict[TaskId, int] = {}
         for task_id in completed_ids:
             ts = final_state.task_states.get(task_id)
-            if (
-                isinstance(ts, TaskState)
-                and ts.started_at is not None
-                and ts.completed_at is not None
-            ):
-                task_ticks_to_complete[task_id] = (
-                    ts.completed_at.tick - ts.started_at.tick
-                )
+            if ts is None or ts.completed_at is None:
+                continue
+            completed_tick = ts.completed_at.tick
+            if makespan is None or completed_tick > makespan:
+                makespan = completed_tick
+            if isinstance(ts, TaskState) and ts.started_at is not None:
+                task_ticks_to_complete[task_id] = completed_tick - ts.started_at.tick
 
         task_ticks_actively_worked: dict[TaskId, int] = {
             task_id: len(ticks) for task_id, ticks in task_ticks_worked_by.items()
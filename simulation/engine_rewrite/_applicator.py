@@ -34,28 +34,29 @@ def apply_outcome(state: SimulationState, outcome: StepOutcome) -> SimulationSta
     """
     new_time = state.t_now + Time(1)
 
-    moved_robots: set[RobotId] = {robot_id for robot_id, _ in outcome.moved}
     worked_robots: set[RobotId] = {robot_id for robot_id, _ in outcome.worked}
     moved_positions: dict[RobotId, Position] = dict(outcome.moved)
+    waypoints = outcome.waypoints
+    robots = state.robots
 
     # --- Robot states ---------------------------------------------------------
     new_robot_states: dict[RobotId, RobotState] = {}
     for robot_id, robot_state in state.robot_states.items():
-        robot = state.robots[robot_id]
-        if robot_id in moved_robots:
-            new_position = moved_positions[robot_id]
-            new_battery = max(0.0, robot_state.battery_level - robot.battery_drain_per_unit_of_movement)
-        elif robot_id in worked_robots:
-            new_position = robot_state.position
-            new_battery = max(0.0, robot_state.battery_level - robot.battery_drain_per_unit_of_work_execution)
+        robot = robots[robot_id]
+        new_position = moved_positions.get(robot_id)
+        if new_position is not None:
+            drain = robot.battery_drain_per_unit_of_movement
         else:
             new_position = robot_state.position
-            new_battery = max(0.0, robot_state.battery_level - robot.battery_drain_per_tick_idle)
+            if robot_id in worked_robots:
+                drain = robot.battery_drain_per_unit_of_work_execution
+            else:
+                drain = robot.battery_drain_per_tick_idle
         new_robot_states[robot_id] = RobotState(
             robot_id=robot_id,
             position=new_position,
-            battery_level=new_battery,
-            current_waypoint=outcome.waypoints.get(robot_id, robot_state.current_waypoint),
+            battery_level=max(0.0, robot_state.battery_level - drain),
+            current_waypoint=waypoints.get(robot_id, robot_state.current_waypoint),
         )
 
     # --- Task states ----------------------------------------------------------
@@ -77,13 +78,15 @@ def apply_outcome(state: SimulationState, outcome: StepOutcome) -> SimulationSta
         )
 
     # Apply rescue point discoveries to SearchTaskState.
-    # Update every SearchTask — there may be more than one.
-    for rp_id in outcome.rescue_points_found:
+    # Update every SearchTask — there may be more than one — once per tick
+    # with everything found this tick, rather than once per rescue point.
+    if outcome.rescue_points_found:
+        found = frozenset(outcome.rescue_points_found)
         for search_task_id, task_state in new_task_states.items():
             if isinstance(task_state, SearchTaskState):
                 new_task_states[search_task_id] = dataclasses.replace(
                     task_state,
-                    rescue_found=task_state.rescue_found | frozenset({rp_id}),
+                    rescue_found=task_state.rescue_found | found,
                 )
 
     # Apply move task position advances
@@ -64,6 +64,8 @@ def classify_step(
     intended_moves: dict[RobotId, Position | None] = {
         robot_id: None for robot_id in state.robot_states
     }
+    # Every robot's cell, built on first use and shared by all MoveTask robots.
+    robot_positions: frozenset[Position] | None = None
 
     for assignment in assignments:
         # Skip if this robot was superseded by a later assignment in the list.
@@ -93,10 +95,11 @@ def classify_step(
         else:
             occupied: frozenset[Position] = frozenset()
             if isinstance(task, MoveTask):
-                occupied = frozenset(
-                    rs.position for rid, rs in state.robot_states.items()
-                    if rid != assignment.robot_id
-                )
+                if robot_positions is None:
+                    robot_positions = frozenset(rs.position for rs in state.robot_states.values())
+                # Robots never share a cell, so removing our own position
+                # leaves exactly the other robots' cells.
+                occupied = robot_positions - {robot_state.position}
             next_position = pathfinding(state.environment, robot_state.position, goal, occupied)
             if next_position is None:
                 outcome.assignments_ignored.append((assignment, IgnoreReason.NO_PATH))
@@ -260,8 +263,12 @@ def classify_step(
         if isinstance(state.tasks.get(assignment.task_id), SearchTask)
     ]
     seen_rescue_ids: set[TaskId] = set()
+    rescue_point_count = len(state.environment.rescue_points)
 
     for assignment in sorted(search_assignments, key=lambda assignment: assignment.robot_id):  # deterministic order
+        # Every rescue point already claimed this tick — remaining robots can't find more.
+        if len(seen_rescue_ids) == rescue_point_count:
+            break
         task_id = assignment.task_id
         task_state = state.task_states[task_id]
         assert isinstance(task_state, SearchTaskState)
@@ -320,7 +327,7 @@ def _ignore_reason(
         return IgnoreReason.TASK_TERMINAL
     if robot_state.battery_level <= 0.0:
         return IgnoreReason.NO_BATTERY
-    if not task.required_capabilities.issubset(robot.capabilities):
+    if task.required_capability_mask & ~robot.capability_mask:
         return IgnoreReason.WRONG_CAPABILITY
     return None
 
@@ -360,7 +367,9 @@ def _resolve_spatial_target(
     zone = state.environment.get_zone(spatial_constraint.target)
     if zone is None:
         return None
-    return min(zone.cells, key=lambda cell: robot_position.manhattan(cell))
+    # Inline Manhattan distance — this runs over every zone cell each tick.
+    rx, ry = robot_position.x, robot_position.y
+    return min(zone.cells, key=lambda cell: abs(cell.x - rx) + abs(cell.y - ry))
 
 
 def _robot_can_work(task: WorkTask, position: Position, state: SimulationState) -> bool:
@@ -376,5 +385,6 @@ def _robot_can_work(task: WorkTask, position: Position, state: SimulationState)
     if zone.contains(position):
         return True
     if spatial_constraint.max_distance > 0:
-        return min(position.manhattan(cell) for cell in zone.cells) <= spatial_constraint.max_distance
+        px, py = position.x, position.y
+        return min(abs(cell.x - px) + abs(cell.y - py) for cell in zone.cells) <= spatial_constraint.max_distance
     return False
@@ -57,7 +57,8 @@ class SimulationRunner:
         robot_states, task_states = self._store.get_snapshot()
         tasks = {t.id: t for t in self._store.all_tasks()}
         robots = {r.id: r for r in self._store.all_robots()}
-        assignments = self._assignment_service.get_current()
+        # Frozen once and shared by the state snapshot and the history entry.
+        assignments = tuple(self._assignment_service.get_current())
 
         current_state = SimulationState(
             environment=self._environment,
@@ -66,7 +67,7 @@ class SimulationRunner:
             tasks=tasks,
             task_states=task_states,
             t_now=self._t_now,
-            assignments=tuple(assignments),
+            assignments=assignments,
         )
 
         new_state, outcome = engine_step(current_state, self._pathfinding)
@@ -81,7 +82,7 @@ class SimulationRunner:
             SimulationHistoryEntry(
                 state=new_state,
                 outcome=outcome,
-                assignments=tuple(assignments),
+                assignments=assignments,
             )
         )
 
@@ -27,24 +27,27 @@ class JsonAssignmentService(BaseAssignmentService):
 
     def __init__(self, path: Path, initial: list[Assignment] | None = None) -> None:
         self._path = path
-        self._cached_mtime: float | None = None
+        # (inode, mtime_ns) of the file the cache was parsed from. Every atomic
+        # write — ours or an external writer's — lands a fresh inode.
+        self._cached_key: tuple[int, int] | None = None
         self._cached: list[Assignment] = []
         if initial is not None:
             self._flush({a.robot_id: a for a in initial})
 
     def get_current(self) -> list[Assignment]:
-        if not self._path.exists():
+        try:
+            st = self._path.stat()
+        except FileNotFoundError:
             return []
-        mtime = self._path.stat().st_mtime
-        if mtime == self._cached_mtime:
+        key = (st.st_ino, st.st_mtime_ns)
+        if key == self._cached_key:
             return list(self._cached)
-        with open(self._path) as f:
-            data = json.load(f)
+        data = json.loads(self._path.read_bytes())
         self._cached = [
             Assignment(task_id=TaskId(a["task_id"]), robot_id=RobotId(a["robot_id"]))
             for a in data
         ]
-        self._cached_mtime = mtime
+        self._cached_key = key
         return list(self._cached)
 
     def update(self, assignments: list[Assignment]) -> None:
@@ -71,4 +74,10 @@ class JsonAssignmentService(BaseAssignmentService):
         with tempfile.NamedTemporaryFile("w", dir=dir_, suffix=".tmp", delete=False) as f:
             json.dump(data, f)
             tmp = f.name
+        # We know what we just wrote — cache it so the next read skips the parse.
+        # Stat the temp file, not the target: rename keeps inode and mtime, and
+        # the target may already hold another writer's file by the time we look.
+        st = os.stat(tmp)
         os.replace(tmp, self._path)
+        self._cached = list(by_robot.values())
+        self._cached_key = (st.st_ino, st.st_mtime_ns)
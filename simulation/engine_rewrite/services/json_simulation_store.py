@@ -25,7 +25,11 @@ from simulation.domain.robot import Robot
 from simulation.domain.robot_state import RobotId, RobotState
 from simulation.domain.search_task import SearchTask, SearchTaskState
 from simulation.domain.task import SpatialConstraint, WorkTask
-from simulation.primitives.capability import Capability
+from simulation.primitives.capability import (
+    Capability,
+    capability_set_from_values,
+    sorted_capability_values,
+)
 from simulation.primitives.position import Position
 from simulation.primitives.time import Time
 from simulation.primitives.zone import ZoneId
@@ -43,6 +47,9 @@ class JsonSimulationStore(BaseSimulationStore):
         assignment_service: Provides current assignments at state-write time.
         scenario_id:        Written into the state JSON for consumer context.
         max_tick:           Written into the state JSON for consumer context.
+        compact_state:      Write the state file without indentation. Off by
+                            default so new runs' state.json artifacts match the
+                            indent=2 format of committed runs.
     """
 
     def __init__(
@@ -52,12 +59,14 @@ class JsonSimulationStore(BaseSimulationStore):
         assignment_service: BaseAssignmentService,
         scenario_id: str = "",
         max_tick: int = 0,
+        compact_state: bool = False,
     ) -> None:
         self._registry_path = registry_path
         self._state_path = state_path
         self._assignment_service = assignment_service
         self._scenario_id = scenario_id
         self._max_tick = max_tick
+        self._state_indent: int | None = None if compact_state else 2
 
         self._cached_mtime: float | None = None
         self._robots: dict[RobotId, Robot] = {}
@@ -119,8 +128,7 @@ class JsonSimulationStore(BaseSimulationStore):
         mtime = self._registry_path.stat().st_mtime
         if mtime == self._cached_mtime:
             return
-        with open(self._registry_path) as f:
-            data = json.load(f)
+        data = json.loads(self._registry_path.read_bytes())
         self._tasks = {t.id: t for t in (_task_from_json(t) for t in data.get("tasks", []))}
         self._robots = {r.id: r for r in (_robot_from_json(r) for r in data.get("robots", []))}
         self._cached_mtime = mtime
@@ -191,26 +199,28 @@ class JsonSimulationStore(BaseSimulationStore):
                 for a in assignments
             ],
         }
-        _atomic_write(self._state_path, data)
+        _atomic_write(self._state_path, data, indent=self._state_indent)
 
 
 # ------------------------------------------------------------------
 # Helpers
 # ------------------------------------------------------------------
 
-def _atomic_write(path: Path, data: Any) -> None:
+def _atomic_write(path: Path, data: Any, indent: int | None = 2) -> None:
+    # Encode in one go: json.dump() issues a write() per token chunk.
+    text = json.dumps(data, indent=indent, separators=None if indent else (",", ":"))
     with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False) as f:
-        json.dump(data, f, indent=2)
+        f.write(text)
         tmp = f.name
     os.replace(tmp, path)
 
 
 def _capabilities_to_json(caps: frozenset[Capability]) -> list[str]:
-    return sorted(c.value for c in caps)
+    return list(sorted_capability_values(caps))
 
 
 def _capabilities_from_json(values: list[str]) -> frozenset[Capability]:
-    return frozenset(Capability(v) for v in values)
+    return capability_set_from_values(values)
 
 
 def _robot_to_json(robot: Robot) -> dict[str, Any]:
@@ -227,7 +237,7 @@ def _robot_to_json(robot: Robot) -> dict[str, Any]:
 def _robot_from_json(data: dict[str, Any]) -> Robot:
     kwargs: dict[str, Any] = dict(
         id=RobotId(int(data["robot_id"])),
-        capabilities=_capabilities_from_json(list(data.get("capabilities", []))),
+        capabilities=_capabilities_from_json(data.get("capabilities", [])),
     )
     if "speed" in data:
         kwargs["speed"] = int(data["speed"])
@@ -298,7 +308,7 @@ def _task_from_json(data: dict[str, Any]) -> BaseTask:
     base_kwargs = dict(
         id=TaskId(int(data["task_id"])),
         priority=int(data.get("priority", 0)),
-        required_capabilities=_capabilities_from_json(list(data.get("required_capabilities", []))),
+        required_capabilities=_capabilities_from_json(data.get("required_capabilities", [])),
     )
 
     if task_type == "search":
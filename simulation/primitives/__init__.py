@@ -1,10 +1,20 @@
-from simulation.primitives.capability import Capability
+from simulation.primitives.capability import (
+    Capability,
+    capability_mask,
+    capability_set_from_values,
+    sorted_capability_names,
+    sorted_capability_values,
+)
 from simulation.primitives.position import Position
 from simulation.primitives.time import Time
 from simulation.primitives.zone import Zone, ZoneId, ZoneType
 
 __all__ = [
     "Capability",
+    "capability_mask",
+    "capability_set_from_values",
+    "sorted_capability_names",
+    "sorted_capability_values",
     "Position",
     "Time",
     "Zone",
@@ -17,6 +17,8 @@ Design notes:
 from __future__ import annotations
 
 from enum import Enum
+from functools import lru_cache
+from typing import Iterable
 
 
 class Capability(Enum):
@@ -51,3 +53,70 @@ class Capability(Enum):
     SENSING = "sensing"
     REPAIR = "repair"
     CHARGING = "charging"
+
+
+# ---------------------------------------------------------------------------
+# Bitmask encoding
+# ---------------------------------------------------------------------------
+
+_CAPABILITY_BITS: dict[Capability, int] = {
+    capability: 1 << index for index, capability in enumerate(Capability)
+}
+"""One bit per capability, assigned in declaration order (stable across runs)."""
+
+
+def capability_mask(capabilities: Iterable[Capability]) -> int:
+    """Encode a collection of capabilities as an int bitmask.
+
+    Subset checks then reduce to a single AND: a robot with mask `have`
+    satisfies a task with mask `need` iff `need & ~have == 0`.
+    """
+    mask = 0
+    for capability in capabilities:
+        mask |= _CAPABILITY_BITS[capability]
+    return mask
+
+
+@lru_cache(maxsize=None)
+def sorted_capability_values(capabilities: frozenset[Capability]) -> tuple[str, ...]:
+    """Return the string values of `capabilities`, sorted, for serialisation.
+
+    Memoised per set: with five capabilities there are at most 32 distinct
+    sets, and every robot and task is serialised on each replay frame.
+    """
+    return tuple(sorted(capability.value for capability in capabilities))
+
+
+@lru_cache(maxsize=None)
+def sorted_capability_names(capabilities: frozenset[Capability]) -> tuple[str, ...]:
+    """Return the member names of `capabilities`, sorted (e.g. "VISION").
+
+    Memoised like `sorted_capability_values`; used where the names, not the
+    serialised values, are shown — the agent's get_state snapshot.
+    """
+    return tuple(sorted(capability.name for capability in capabilities))
+
+
+_CAPABILITY_BY_VALUE: dict[str, Capability] = {c.value: c for c in Capability}
+
+
+def capability_set_from_values(values: Iterable[str]) -> frozenset[Capability]:
+    """Parse serialised capability values back into a frozenset.
+
+    Inverse of `sorted_capability_values`. Raises ValueError naming the first
+    unknown value.
+    """
+    return _capability_set(tuple(values))
+
+
+@lru_cache(maxsize=None)
+def _capability_set(values: tuple[str, ...]) -> frozenset[Capability]:
+    # Interned: loaders re-parse the same handful of capability lists for
+    # every robot and task, so each distinct list maps to one shared frozenset.
+    try:
+        return frozenset(_CAPABILITY_BY_VALUE[v] for v in values)
+    except KeyError as e:
+        raise ValueError(
+            f"{e.args[0]!r} is not a valid Capability "
+            f"(expected one of {sorted(_CAPABILITY_BY_VALUE)})"
+        ) from None
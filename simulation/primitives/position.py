@@ -14,12 +14,35 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
-class Position:
-    """Immutable integer grid cell coordinate."""
+class _HashSlot:
+    """Storage for Position's cached hash, kept out of the dataclass fields."""
+
+    __slots__ = ("_hash",)
+
+
+@dataclass(frozen=True, slots=True)
+class Position(_HashSlot):
+    """Immutable integer grid cell coordinate.
+
+    The hash is computed once at construction: positions are hashed far more
+    often (set/dict keys, memoised pathfinding) than they are created. It
+    equals the default dataclass hash, `hash((x, y))`, and lives in a slot
+    inherited from `_HashSlot`, so `fields()`/`asdict()` still see only x, y.
+    """
     x: int
     y: int
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.x, self.y)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        # Rebuild through __init__ so the cached hash is recomputed; the
+        # dataclass slot pickling restores fields only.
+        return (Position, (self.x, self.y))
+
     def manhattan(self, other: "Position") -> int:
         """Return the Manhattan distance to another position."""
         return abs(self.x - other.x) + abs(self.y - other.y)
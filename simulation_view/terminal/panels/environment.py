@@ -7,6 +7,8 @@ work areas, rescue points, and zones overlaid.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from simulation.domain import (
     TaskId, TaskStatus, Environment, MoveTask, MoveTaskState, SearchTask,
     SearchTaskState, WorkTask, )
@@ -52,14 +54,14 @@ def render_environment(state: SimulationState) -> list[str]:
         and ts.status not in (TaskStatus.DONE, TaskStatus.FAILED)
     }
 
+    obstacles = env.obstacles
     rows: list[str] = []
-    for y in range(env.height):
+    for row_cells in _grid_positions(env.width, env.height):
         row_chars: list[str] = []
-        for x in range(env.width):
-            pos = Position(x, y)
+        for pos in row_cells:
             if pos in robot_positions:
                 symbol = ROBOT_SYMBOL
-            elif pos in env.obstacles:
+            elif pos in obstacles:
                 symbol = OBSTACLE_SYMBOL
             elif pos in rescue_point_positions:
                 symbol = RESCUE_POINT_SYMBOL
@@ -83,6 +85,16 @@ def render_environment(state: SimulationState) -> list[str]:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=4)
+def _grid_positions(width: int, height: int) -> tuple[tuple[Position, ...], ...]:
+    """Every cell's Position, row by row.
+
+    Built once per grid size and reused by every frame, rather than
+    allocating width * height Positions per render.
+    """
+    return tuple(tuple(Position(x, y) for x in range(width)) for y in range(height))
+
+
 def _compute_task_work_areas(
     state: SimulationState,
 ) -> tuple[dict[Position, TaskId], dict[Position, TaskId]]:
@@ -127,7 +139,7 @@ def _compute_task_work_areas(
 
 def _zone_symbol_at(env: Environment, pos: Position) -> str | None:
     """Return the zone display symbol for pos, or None if not in any zone."""
-    for zone in env._zones.values():
-        if zone.contains(pos):
-            return ZONE_SYMBOLS.get(zone.zone_type, "?")
-    return None
+    zone_id = env.zone_id_at(pos)
+    if zone_id is None:
+        return None
+    return ZONE_SYMBOLS.get(env.zones[zone_id].zone_type, "?")
@@ -12,10 +12,15 @@ Covers:
 - 1-wide corridor → can navigate through
 - Returned step is always cardinal (Manhattan distance == 1 from start)
 - Determinism: same inputs always produce same output
+- Memoised results are invalidated when an obstacle is added
+- Returned step lies on a shortest path (checked against BFS distances)
 """
 
 from __future__ import annotations
 
+import random
+from collections import deque
+
 from simulation.algorithms import astar_pathfind
 from simulation.domain import Environment
 from simulation.primitives import Position
@@ -130,7 +135,7 @@ def test_returns_none_for_out_of_bounds_goal():
     # Act
     result = astar_pathfind(env, start, goal)
 
-    # Assert: _neighbors never generates out-of-bounds cells so goal is never found
+    # Assert: the explicit bounds check rejects the goal before any search runs
     assert result is None
 
 
@@ -188,3 +193,54 @@ def test_deterministic_same_inputs_same_output():
     # Assert: heap ordering is deterministic — same first step every time
     assert result1 is not None
     assert result1 == result2
+
+
+def test_cached_result_invalidated_when_obstacle_added():
+    # Arrange: direct route east is open on the first query
+    env = Environment(3, 3)
+    start = Position(0, 0)
+    goal = Position(2, 0)
+    assert astar_pathfind(env, start, goal) == Position(1, 0)
+
+    # Act: block the direct route and repeat the identical query
+    env.add_obstacle(Position(1, 0))
+    result = astar_pathfind(env, start, goal)
+
+    # Assert: the new obstacle is honoured, not the memoised first step
+    assert result == Position(0, 1)
+
+
+def _bfs_distances(env: Environment, goal: Position) -> dict[Position, int]:
+    dist = {goal: 0}
+    queue = deque([goal])
+    while queue:
+        p = queue.popleft()
+        for n in (Position(p.x + 1, p.y), Position(p.x - 1, p.y),
+                  Position(p.x, p.y + 1), Position(p.x, p.y - 1)):
+            if env.in_bounds(n) and n not in env.obstacles and n not in dist:
+                dist[n] = dist[p] + 1
+                queue.append(n)
+    return dist
+
+
+def test_step_lies_on_a_shortest_path():
+    # Arrange: seeded random grids with scattered obstacles
+    rng = random.Random(0)
+    for _ in range(200):
+        env = Environment(8, 8)
+        for _ in range(rng.randint(0, 20)):
+            env.add_obstacle(Position(rng.randrange(8), rng.randrange(8)))
+        free = [Position(x, y) for x in range(8) for y in range(8)
+                if Position(x, y) not in env.obstacles]
+        start, goal = rng.choice(free), rng.choice(free)
+        dist = _bfs_distances(env, goal)
+
+        # Act
+        result = astar_pathfind(env, start, goal)
+
+        # Assert: the step is one move closer to the goal, or None iff unreachable
+        if start not in dist:
+            assert result is None
+        elif start != goal:
+            assert result is not None
+            assert dist[result] == dist[start] - 1
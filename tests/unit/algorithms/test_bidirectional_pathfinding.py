@@ -0,0 +1,117 @@
+"""
+Unit tests for bidirectional_pathfind.
+
+Covers:
+- Already at goal → returns goal
+- Start on obstacle → None
+- Unreachable goal (enclosed by obstacles) → None
+- Out-of-bounds start or goal → None, as astar_pathfind
+- Adjacent goal → returns goal
+- Goal on an obstacle or occupied cell → still reachable
+- Occupied cells are avoided
+- Following the returned steps reaches the goal in the same number of
+  moves as astar_pathfind (shortest path) on a maze with detours
+"""
+
+from __future__ import annotations
+
+from simulation.algorithms import astar_pathfind, bidirectional_pathfind
+from simulation.domain import Environment
+from simulation.primitives import Position
+
+
+def _walk(pathfinding, env: Environment, start: Position, goal: Position) -> int:
+    """Follow first steps until goal; return the number of moves taken."""
+    pos, moves = start, 0
+    while pos != goal:
+        nxt = pathfinding(env, pos, goal)
+        assert nxt is not None
+        assert pos.manhattan(nxt) == 1
+        pos, moves = nxt, moves + 1
+        assert moves <= env.width * env.height
+    return moves
+
+
+def test_returns_goal_when_already_at_goal():
+    env = Environment(5, 5)
+
+    assert bidirectional_pathfind(env, Position(2, 2), Position(2, 2)) == Position(2, 2)
+
+
+def test_returns_none_when_start_on_obstacle():
+    env = Environment(5, 5)
+    env.add_obstacle(Position(0, 0))
+
+    assert bidirectional_pathfind(env, Position(0, 0), Position(4, 4)) is None
+
+
+def test_returns_none_when_goal_unreachable():
+    # Arrange: goal sealed off on all four cardinal sides
+    env = Environment(5, 5)
+    for pos in [Position(1, 2), Position(3, 2), Position(2, 1), Position(2, 3)]:
+        env.add_obstacle(pos)
+
+    # Act / Assert
+    assert bidirectional_pathfind(env, Position(0, 0), Position(2, 2)) is None
+
+
+def test_returns_none_when_goal_out_of_bounds():
+    env = Environment(5, 5)
+
+    assert bidirectional_pathfind(env, Position(0, 0), Position(9, 9)) is None
+
+
+def test_returns_none_when_start_out_of_bounds_like_astar():
+    env = Environment(5, 5)
+    start, goal = Position(-1, 0), Position(3, 0)
+
+    assert astar_pathfind(env, start, goal) is None
+    assert bidirectional_pathfind(env, start, goal) is None
+
+
+def test_adjacent_goal_returned_directly():
+    env = Environment(5, 5)
+
+    assert bidirectional_pathfind(env, Position(1, 1), Position(2, 1)) == Position(2, 1)
+
+
+def test_goal_on_obstacle_or_occupied_is_still_reachable():
+    # Arrange
+    env = Environment(5, 1)
+    env.add_obstacle(Position(4, 0))
+    occupied = frozenset({Position(4, 0)})
+
+    # Act
+    result = bidirectional_pathfind(env, Position(0, 0), Position(4, 0), occupied)
+
+    # Assert
+    assert result == Position(1, 0)
+
+
+def test_occupied_cells_are_avoided():
+    # Arrange: direct route east blocked by another robot
+    env = Environment(3, 3)
+    occupied = frozenset({Position(1, 0)})
+
+    # Act
+    result = bidirectional_pathfind(env, Position(0, 0), Position(2, 0), occupied)
+
+    # Assert: must detour south
+    assert result == Position(0, 1)
+
+
+def test_path_length_matches_astar_on_maze():
+    # Arrange: serpentine walls force long detours
+    env = Environment(9, 9)
+    for x in range(0, 8):
+        env.add_obstacle(Position(x, 2))
+    for x in range(1, 9):
+        env.add_obstacle(Position(x, 5))
+    start, goal = Position(0, 0), Position(0, 8)
+
+    # Act
+    bidirectional_moves = _walk(bidirectional_pathfind, env, start, goal)
+    astar_moves = _walk(astar_pathfind, env, start, goal)
+
+    # Assert
+    assert bidirectional_moves == astar_moves
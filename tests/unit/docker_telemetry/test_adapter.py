@@ -0,0 +1,85 @@
+"""
+Unit tests for the telemetry adapter.
+
+build_all_telemetry must produce, for every robot, exactly what a separate
+build_telemetry call for that robot produces — on a hand-built tick that
+exercises every action and a full fixture run.
+"""
+
+from __future__ import annotations
+
+from docker_telemetry.adapter import build_all_telemetry, build_telemetry
+from docker_telemetry.telemetry import RobotAction
+from simulation.domain import Assignment, Environment, RobotId, RobotState, TaskId, WorkTask
+from simulation.domain.robot import Robot
+from simulation.domain.simulation_state import SimulationState
+from simulation.domain.step_outcome import IgnoreReason, StepOutcome
+from simulation.domain.task_state import TaskState
+from simulation.primitives import Capability, Position, Time
+from tests.integration.fixtures.dual_rescue import run as run_dual_rescue
+
+_TASK = TaskId(10)
+
+
+def _tick() -> tuple[SimulationState, StepOutcome]:
+    robot_ids = [RobotId(i) for i in (1, 2, 3, 4)]
+    assignments = tuple(Assignment(task_id=_TASK, robot_id=rid) for rid in robot_ids)
+    state = SimulationState(
+        environment=Environment(5, 5),
+        robots={rid: Robot(id=rid, capabilities=frozenset({Capability.VISION})) for rid in robot_ids},
+        robot_states={
+            rid: RobotState(robot_id=rid, position=Position(int(rid), 0)) for rid in robot_ids
+        },
+        tasks={_TASK: WorkTask(
+            id=_TASK,
+            priority=1,
+            required_capabilities=frozenset({Capability.VISION}),
+            required_work_time=Time(5),
+            deadline=Time(9),
+        )},
+        task_states={_TASK: TaskState(task_id=_TASK)},
+        t_now=Time(4),
+        assignments=assignments,
+    )
+    outcome = StepOutcome(
+        moved=[(RobotId(1), Position(1, 1))],
+        worked=[(RobotId(2), _TASK)],
+        robots_stuck=[RobotId(3)],
+        assignments_ignored=[(assignments[3], IgnoreReason.NO_BATTERY)],
+    )
+    return state, outcome
+
+
+def test_matches_per_robot_build_on_hand_built_tick():
+    state, outcome = _tick()
+
+    telemetry = build_all_telemetry(state, outcome)
+
+    assert telemetry == {rid: build_telemetry(rid, state, outcome) for rid in state.robot_states}
+
+
+def test_classifies_every_action_on_hand_built_tick():
+    state, outcome = _tick()
+
+    telemetry = build_all_telemetry(state, outcome)
+
+    assert {rid: t.action for rid, t in telemetry.items()} == {
+        RobotId(1): RobotAction.MOVED,
+        RobotId(2): RobotAction.WORKED,
+        RobotId(3): RobotAction.STUCK,
+        RobotId(4): RobotAction.IDLE,
+    }
+    assert telemetry[RobotId(4)].ignore_reasons == (IgnoreReason.NO_BATTERY,)
+    assert telemetry[RobotId(2)].assigned_task_ids == (_TASK,)
+    assert telemetry[RobotId(2)].task_complexity == 5
+    assert telemetry[RobotId(2)].deadline_delta_ticks == 5
+
+
+def test_matches_per_robot_build_over_fixture_run():
+    _, _, runner = run_dual_rescue()
+
+    for entry in runner._history:
+        state, outcome = entry.state, entry.outcome
+        assert build_all_telemetry(state, outcome) == {
+            rid: build_telemetry(rid, state, outcome) for rid in state.robot_states
+        }
@@ -94,6 +94,35 @@ def test_add_obstacle_blocks_cell():
     assert not env.is_empty(pos)
 
 
+def test_add_obstacles_blocks_all_cells():
+    env = _env()
+    positions = [Position(0, 0), Position(2, 2), Position(2, 2)]
+    env.add_obstacles(positions)
+    assert env.obstacles == frozenset(positions)
+    assert not env.is_empty(Position(0, 0))
+    assert not env.is_empty(Position(2, 2))
+
+
+def test_add_obstacles_is_atomic_on_invalid_position():
+    env = _env()
+    with pytest.raises(IndexError):
+        env.add_obstacles([Position(1, 1), Position(9, 9)])
+    assert env.obstacles == frozenset()
+    assert env.is_empty(Position(1, 1))
+
+
+def test_obstacles_view_stable_until_obstacle_added():
+    env = _env()
+    env.add_obstacle(Position(1, 1))
+    view = env.obstacles
+    assert env.obstacles is view
+    env.add_obstacle(Position(1, 1))  # already present: no change
+    assert env.obstacles is view
+    env.add_obstacle(Position(2, 1))
+    assert env.obstacles is not view
+    assert Position(2, 1) in env.obstacles
+
+
 # ---------------------------------------------------------------------------
 # add_zone / get_zone
 # ---------------------------------------------------------------------------
@@ -109,6 +138,25 @@ def test_add_zone_registers_cells():
     assert retrieved.contains(p2)
 
 
+def test_add_zone_rejects_overlap_and_leaves_state_unchanged():
+    env = _env()
+    env.add_zone(_zone(1, Position(0, 0), Position(1, 0)))
+    env.add_zone(_zone(2, Position(3, 3)))
+    with pytest.raises(ValueError, match="overlaps with existing zone 1"):
+        env.add_zone(_zone(3, Position(1, 0), Position(3, 3), Position(4, 4)))
+    assert env.get_zone(ZoneId(3)) is None
+    assert env.zone_id_at(Position(4, 4)) is None
+
+
+def test_zone_id_at_resolves_zone_cells():
+    env = _env()
+    env.add_zone(_zone(1, Position(0, 0), Position(1, 0)))
+    env.add_zone(_zone(2, Position(4, 4)))
+    assert env.zone_id_at(Position(1, 0)) == ZoneId(1)
+    assert env.zone_id_at(Position(4, 4)) == ZoneId(2)
+    assert env.zone_id_at(Position(2, 2)) is None
+
+
 # ---------------------------------------------------------------------------
 # add_rescue_point
 # ---------------------------------------------------------------------------
@@ -130,3 +178,15 @@ def test_is_empty_on_fresh_grid():
     for y in range(3):
         for x in range(3):
             assert env.is_empty(Position(x, y))
+
+
+# ---------------------------------------------------------------------------
+# __repr__
+# ---------------------------------------------------------------------------
+
+def test_repr_renders_empty_zone_and_occupied_cells():
+    env = _env(width=4, height=2)
+    env.add_zone(_zone(3, Position(0, 0), Position(1, 0)))
+    env.add_obstacle(Position(1, 0))
+    env.add_zone(_zone(12, Position(3, 1)))
+    assert repr(env) == "Environment(width=4, height=2)\n3#..\n...+"
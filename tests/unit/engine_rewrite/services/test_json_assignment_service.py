@@ -0,0 +1,52 @@
+import json
+import os
+
+from simulation.domain import TaskId, RobotId
+from simulation.engine_rewrite import Assignment
+from simulation.engine_rewrite.services import JsonAssignmentService
+from simulation.engine_rewrite.services import json_assignment_service
+
+
+def _assign(robot_id: int, task_id: int) -> Assignment:
+    return Assignment(task_id=TaskId(task_id), robot_id=RobotId(robot_id))
+
+
+def _external_write(path, assignments: list[Assignment]) -> None:
+    """Write the file the way another process (e.g. the MCP server) would: temp + rename."""
+    tmp = path.with_suffix(".external.tmp")
+    tmp.write_text(json.dumps([{"robot_id": a.robot_id, "task_id": a.task_id} for a in assignments]))
+    os.replace(tmp, path)
+
+
+def test_reads_back_own_writes(tmp_path):
+    service = JsonAssignmentService(tmp_path / "assignments.json", initial=[_assign(1, 10)])
+    service.update([_assign(2, 20)])
+    assert set(service.get_current()) == {_assign(1, 10), _assign(2, 20)}
+
+
+def test_external_write_after_flush_is_picked_up(tmp_path):
+    path = tmp_path / "assignments.json"
+    service = JsonAssignmentService(path, initial=[_assign(1, 10)])
+    before = path.stat()
+
+    _external_write(path, [_assign(1, 99)])
+    # Same mtime as our own write: only the new file identity tells them apart.
+    os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+    assert service.get_current() == [_assign(1, 99)]
+
+
+def test_external_write_racing_flush_is_not_cached_as_ours(tmp_path, monkeypatch):
+    path = tmp_path / "assignments.json"
+    service = JsonAssignmentService(path)
+    real_replace = os.replace
+
+    def replace_then_external_write(src, dst):
+        real_replace(src, dst)
+        monkeypatch.setattr(json_assignment_service.os, "replace", real_replace)
+        _external_write(path, [_assign(1, 99)])
+
+    monkeypatch.setattr(json_assignment_service.os, "replace", replace_then_external_write)
+    service.update([_assign(1, 10)])
+
+    assert service.get_current() == [_assign(1, 99)]
@@ -0,0 +1,39 @@
+import json
+
+from simulation.domain import RobotId, RobotState
+from simulation.domain.robot import Robot
+from simulation.primitives import Capability, Position
+from simulation.engine_rewrite.services import InMemoryAssignmentService, JsonSimulationStore
+
+
+def _store(tmp_path, **kwargs) -> JsonSimulationStore:
+    store = JsonSimulationStore(
+        registry_path=tmp_path / "registry.json",
+        state_path=tmp_path / "state.json",
+        assignment_service=InMemoryAssignmentService(),
+        **kwargs,
+    )
+    state = RobotState(robot_id=RobotId(1), position=Position(2, 3))
+    store.add_robot(Robot(id=RobotId(1), capabilities=frozenset({Capability.VISION})), state)
+    store.apply({RobotId(1): state}, {})
+    return store
+
+
+def test_state_file_is_indented_by_default(tmp_path):
+    _store(tmp_path)
+    text = (tmp_path / "state.json").read_text()
+
+    assert text == json.dumps(json.loads(text), indent=2)
+
+
+def test_compact_state_writes_same_data_without_whitespace(tmp_path):
+    (tmp_path / "default").mkdir()
+    (tmp_path / "compact").mkdir()
+    _store(tmp_path / "default")
+    _store(tmp_path / "compact", compact_state=True)
+
+    default = (tmp_path / "default" / "state.json").read_text()
+    compact = (tmp_path / "compact" / "state.json").read_text()
+
+    assert json.loads(compact) == json.loads(default)
+    assert "\n" not in compact and ", " not in compact
@@ -0,0 +1,204 @@
+"""
+Tests for AssignmentAgent.
+
+The LLM is replaced by a scripted `litellm.acompletion` and the tool handlers
+by recording stubs, so these tests cover the agent's own bookkeeping — which
+tool calls reach a handler, and how the history window is trimmed — without
+any network access.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+litellm = pytest.importorskip("litellm")
+
+from llm.agent import AssignmentAgent
+
+
+def _tool_call(call_id: str, name: str, arguments: str = "{}") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=call_id,
+        function=SimpleNamespace(name=name, arguments=arguments),
+        model_dump=lambda: {"id": call_id, "function": {"name": name, "arguments": arguments}},
+    )
+
+
+def _response(tool_calls: list | None = None, content: str | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content, tool_calls=tool_calls))],
+        usage=None,
+    )
+
+
+def _scripted_completion(monkeypatch, responses: list[SimpleNamespace]) -> list[list[dict]]:
+    """Make litellm.acompletion return `responses` in order; return the sent messages."""
+    sent: list[list[dict]] = []
+    remaining = iter(responses)
+
+    async def fake_acompletion(**kwargs):
+        sent.append(list(kwargs["messages"]))
+        return next(remaining)
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    return sent
+
+
+def _agent(**kwargs) -> AssignmentAgent:
+    return AssignmentAgent(model="test/model", store=None, assignment_service=None, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# get_state sharing within a tool round
+# ---------------------------------------------------------------------------
+
+def _round(*names: str) -> SimpleNamespace:
+    return _response(tool_calls=[_tool_call(f"call_{i}", name) for i, name in enumerate(names)])
+
+
+def _counting_handlers(write_raises: bool = False) -> tuple[dict, list[str]]:
+    calls: list[str] = []
+
+    def get_state(_args: dict) -> str:
+        calls.append("get_state")
+        return f"state #{calls.count('get_state')}"
+
+    def write_assignments(_args: dict) -> str:
+        calls.append("write_assignments")
+        if write_raises:
+            raise RuntimeError("write failed part-way")
+        return "written"
+
+    return {"get_state": get_state, "write_assignments": write_assignments}, calls
+
+
+def test_repeated_get_state_in_one_round_runs_once(monkeypatch):
+    _scripted_completion(monkeypatch, [_round("get_state", "get_state"), _response(content="done")])
+    agent = _agent()
+    agent._handlers, calls = _counting_handlers()
+
+    asyncio.run(agent.invoke("tick"))
+
+    assert calls == ["get_state"]
+
+
+@pytest.mark.parametrize("write_raises", [False, True])
+def test_get_state_after_write_in_same_round_is_rerun(monkeypatch, write_raises):
+    _scripted_completion(
+        monkeypatch,
+        [_round("get_state", "write_assignments", "get_state"), _response(content="done")],
+    )
+    agent = _agent()
+    agent._handlers, calls = _counting_handlers(write_raises=write_raises)
+
+    asyncio.run(agent.invoke("tick"))
+
+    assert calls == ["get_state", "write_assignments", "get_state"]
+
+
+def test_get_state_after_unknown_tool_in_same_round_is_rerun(monkeypatch):
+    _scripted_completion(
+        monkeypatch,
+        [_round("get_state", "no_such_tool", "get_state"), _response(content="done")],
+    )
+    agent = _agent()
+    agent._handlers, calls = _counting_handlers()
+
+    asyncio.run(agent.invoke("tick"))
+
+    assert calls == ["get_state", "get_state"]
+
+
+# ---------------------------------------------------------------------------
+# History window (max_history_messages)
+# ---------------------------------------------------------------------------
+
+def _user(text: str) -> dict:
+    return {"role": "user", "content": text}
+
+
+def _assistant_with_tool_call(call_id: str) -> dict:
+    return {"role": "assistant", "content": None, "tool_calls": [{"id": call_id}]}
+
+
+def _tool_result(call_id: str) -> dict:
+    return {"role": "tool", "tool_call_id": call_id, "content": "ok"}
+
+
+def _assistant(text: str) -> dict:
+    return {"role": "assistant", "content": text}
+
+
+def _turn(n: int) -> list[dict]:
+    """One completed turn: user, assistant tool call, tool result, reply — 4 messages."""
+    return [
+        _user(f"turn {n}"),
+        _assistant_with_tool_call(f"call_{n}"),
+        _tool_result(f"call_{n}"),
+        _assistant(f"reply {n}"),
+    ]
+
+
+def test_no_window_keeps_full_history():
+    agent = _agent()
+    history = [*_turn(1), *_turn(2), *_turn(3), _user("turn 4")]
+    agent._history = list(history)
+
+    agent._trim_history()
+
+    assert agent._history == history
+
+
+def test_trim_cuts_at_user_message_boundary():
+    agent = _agent(max_history_messages=6)
+    agent._history = [*_turn(1), *_turn(2), _user("turn 3")]
+
+    agent._trim_history()
+
+    # 9 messages, 3 over: the cut moves forward to the next user message.
+    assert agent._history == [*_turn(2), _user("turn 3")]
+    assert agent._history[0]["role"] == "user"
+
+
+def test_trim_never_separates_tool_calls_from_their_results():
+    agent = _agent(max_history_messages=7)
+    agent._history = [*_turn(1), *_turn(2), _user("turn 3")]
+
+    agent._trim_history()
+
+    # A plain 7-message tail would start at turn 1's tool result, orphaned
+    # from the assistant message that requested it.
+    call_ids = {
+        tc["id"]
+        for m in agent._history if m["role"] == "assistant"
+        for tc in m.get("tool_calls", [])
+    }
+    result_ids = {m["tool_call_id"] for m in agent._history if m["role"] == "tool"}
+    assert call_ids == result_ids == {"call_2"}
+
+
+def test_trim_always_keeps_current_turn():
+    agent = _agent(max_history_messages=1)
+    agent._history = [*_turn(1), *_turn(2), _user("turn 3")]
+
+    agent._trim_history()
+
+    assert agent._history == [_user("turn 3")]
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_window_below_one_is_rejected(limit):
+    with pytest.raises(ValueError, match="max_history_messages"):
+        _agent(max_history_messages=limit)
+
+
+def test_trim_keeps_system_message_in_every_request(monkeypatch):
+    sent = _scripted_completion(monkeypatch, [_response(content="done")])
+    agent = _agent(system="You assign robots.", max_history_messages=2)
+    agent._history = [*_turn(1), *_turn(2)]
+
+    asyncio.run(agent.invoke("turn 3"))
+
+    assert sent[0][0] == {"role": "system", "content": "You assign robots."}
+    assert sent[0][1:] == [_user("turn 3")]
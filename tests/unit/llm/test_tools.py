@@ -0,0 +1,43 @@
+"""
+Tests for make_tools: the schema list and the get_state tool's output format.
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("langsmith")
+
+from llm.tools import make_tools
+from simulation.engine_rewrite.services.in_memory_assignment_service import InMemoryAssignmentService
+from simulation.engine_rewrite.services.in_memory_simulation_store import InMemorySimulationStore
+
+
+def _get_state(**kwargs) -> str:
+    _schemas, handlers = make_tools(InMemorySimulationStore(), InMemoryAssignmentService(), **kwargs)
+    return handlers["get_state"]({})
+
+
+def test_get_state_is_indented_by_default():
+    result = _get_state()
+
+    assert result == json.dumps(json.loads(result), indent=2)
+
+
+def test_compact_state_drops_whitespace_but_not_content():
+    default = _get_state()
+    compact = _get_state(compact_state=True)
+
+    assert json.loads(compact) == json.loads(default)
+    assert "\n" not in compact and ", " not in compact and ": " not in compact
+
+
+def test_each_call_gets_its_own_schema_list():
+    first, _ = make_tools(InMemorySimulationStore(), InMemoryAssignmentService())
+    second, _ = make_tools(InMemorySimulationStore(), InMemoryAssignmentService())
+
+    first.append({"type": "function", "function": {"name": "extra"}})
+    first[0]["function"]["description"] = "changed"
+
+    assert len(second) == 2
+    assert second[0]["function"]["description"] != "changed"
@@ -0,0 +1,83 @@
+"""
+Unit tests for capability_mask, sorted_capability_values,
+sorted_capability_names and capability_set_from_values.
+
+Covers:
+- Empty collection → 0
+- Each capability maps to a distinct single bit
+- Mask of a set is the OR of its members' masks
+- Subset relation is preserved by the AND-NOT check
+- sorted_capability_values returns sorted string values
+- sorted_capability_names returns sorted member names
+- capability_set_from_values inverts it and rejects unknown values
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from simulation.primitives import (
+    Capability,
+    capability_mask,
+    capability_set_from_values,
+    sorted_capability_names,
+    sorted_capability_values,
+)
+
+
+def test_empty_is_zero():
+    assert capability_mask(frozenset()) == 0
+
+
+def test_each_capability_is_a_distinct_single_bit():
+    masks = [capability_mask({c}) for c in Capability]
+
+    assert len(set(masks)) == len(Capability)
+    assert all(m & (m - 1) == 0 and m != 0 for m in masks)
+
+
+def test_mask_is_union_of_members():
+    caps = {Capability.VISION, Capability.REPAIR}
+
+    assert capability_mask(caps) == (
+        capability_mask({Capability.VISION}) | capability_mask({Capability.REPAIR})
+    )
+
+
+def test_subset_check_matches_frozenset_issubset():
+    have = frozenset({Capability.VISION, Capability.MANIPULATION})
+    for need in (
+        frozenset(),
+        frozenset({Capability.VISION}),
+        frozenset({Capability.VISION, Capability.MANIPULATION}),
+        frozenset({Capability.SENSING}),
+        frozenset({Capability.VISION, Capability.CHARGING}),
+    ):
+        bitmask_ok = capability_mask(need) & ~capability_mask(have) == 0
+        assert bitmask_ok == need.issubset(have)
+
+
+def test_sorted_capability_values():
+    caps = frozenset({Capability.VISION, Capability.CHARGING, Capability.REPAIR})
+
+    assert sorted_capability_values(caps) == ("charging", "repair", "vision")
+    assert sorted_capability_values(frozenset()) == ()
+
+
+def test_sorted_capability_names():
+    caps = frozenset({Capability.VISION, Capability.CHARGING, Capability.REPAIR})
+
+    assert sorted_capability_names(caps) == ("CHARGING", "REPAIR", "VISION")
+    assert sorted_capability_names(frozenset()) == ()
+
+
+def test_capability_set_from_values_round_trips():
+    caps = frozenset({Capability.VISION, Capability.CHARGING, Capability.REPAIR})
+
+    assert capability_set_from_values(sorted_capability_values(caps)) == caps
+    assert capability_set_from_values([]) == frozenset()
+
+
+def test_capability_set_from_values_rejects_unknown_value():
+    with pytest.raises(ValueError, match="'flying' is not a valid Capability"):
+        capability_set_from_values(["vision", "flying"])
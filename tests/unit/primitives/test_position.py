@@ -0,0 +1,30 @@
+import copy
+import dataclasses
+import pickle
+
+from simulation.primitives import Position
+
+
+def test_fields_are_only_x_and_y():
+    assert [f.name for f in dataclasses.fields(Position)] == ["x", "y"]
+
+
+def test_asdict_and_astuple_hold_only_coordinates():
+    assert dataclasses.asdict(Position(2, 3)) == {"x": 2, "y": 3}
+    assert dataclasses.astuple(Position(2, 3)) == (2, 3)
+
+
+def test_hash_matches_coordinate_tuple():
+    assert hash(Position(2, 3)) == hash((2, 3))
+
+
+def test_pickle_and_copy_round_trip_keep_hash():
+    pos = Position(2, 3)
+    for clone in (pickle.loads(pickle.dumps(pos)), copy.copy(pos), copy.deepcopy(pos)):
+        assert clone == pos
+        assert hash(clone) == hash(pos)
+
+
+def test_replace_recomputes_hash():
+    moved = dataclasses.replace(Position(2, 3), x=4)
+    assert hash(moved) == hash((4, 3))
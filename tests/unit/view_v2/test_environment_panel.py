@@ -7,7 +7,7 @@ from simulation.domain import (
     SearchTask, SearchTaskState, WorkTask, SpatialConstraint, TaskState,
 )
 from simulation.engine_rewrite import SimulationState
-from simulation.primitives import Position, Time
+from simulation.primitives import Position, Time, Zone, ZoneId, ZoneType
 
 from simulation_view.terminal.panels.environment import render_environment
 from simulation_view.terminal.symbols import (
@@ -16,6 +16,7 @@ from simulation_view.terminal.symbols import (
     TASK_AREA_SYMBOL,
     RESCUE_POINT_SYMBOL,
     EMPTY_SYMBOL,
+    ZONE_SYMBOLS,
 )
 
 
@@ -74,6 +75,17 @@ def test_obstacle_symbol():
     assert _cell(lines, 1, 0) == OBSTACLE_SYMBOL
 
 
+def test_zone_cells_show_zone_symbol():
+    def add_zone(env):
+        env.add_zone(Zone.from_positions(
+            id=ZoneId(1), zone_type=ZoneType.CHARGING, positions=[Position(3, 2)],
+        ))
+
+    lines = render_environment(_state(env_extra=add_zone))
+    assert _cell(lines, 3, 2) == ZONE_SYMBOLS[ZoneType.CHARGING]
+    assert _cell(lines, 2, 2) == EMPTY_SYMBOL
+
+
 def test_task_target_shows_task_id():
     task = WorkTask(
         id=TaskId(3),
@@ -16,6 +16,7 @@ from __future__ import annotations
 import argparse
 import json
 import time
+from functools import lru_cache
 from pathlib import Path
 
 from simulation.domain.assignment import Assignment
@@ -29,7 +30,7 @@ from simulation.domain.simulation_state import SimulationState
 from simulation.domain.task import SpatialConstraint, WorkTask
 from simulation.domain.task_state import TaskState
 from simulation.domain.base_task import TaskId, TaskStatus
-from simulation.primitives.capability import Capability
+from simulation.primitives.capability import capability_set_from_values
 from simulation.primitives.position import Position
 from simulation.primitives.time import Time
 from simulation.primitives.zone import Zone, ZoneId, ZoneType
@@ -41,8 +42,22 @@ from simulation_view.terminal.terminal_view_service import TerminalViewService
 # Deserializers
 # ---------------------------------------------------------------------------
 
+# Value -> member tables: a dict hit is much cheaper than Enum.__call__,
+# and every frame re-parses every task and zone. Misses are reported as
+# ValueError naming the field, as Enum.__call__ would.
+_TASK_STATUSES: dict[str, TaskStatus] = {s.value: s for s in TaskStatus}
+_ZONE_TYPES: dict[str, ZoneType] = {z.value: z for z in ZoneType}
+
+
+@lru_cache(maxsize=None)
+def _cell(x: int, y: int) -> Position:
+    # Every frame repeats the same grid cells; share one Position per cell
+    # instead of allocating a fresh one per robot, task and obstacle per frame.
+    return Position(x, y)
+
+
 def _pos(d: dict) -> Position:
-    return Position(d["x"], d["y"])
+    return _cell(d["x"], d["y"])
 
 
 def _spatial_constraint(d: dict) -> SpatialConstraint:
@@ -54,7 +69,7 @@ def _spatial_constraint(d: dict) -> SpatialConstraint:
 
 
 def _task(d: dict) -> WorkTask | SearchTask | MoveTask:
-    caps = frozenset(Capability(c) for c in d["required_capabilities"])
+    caps = capability_set_from_values(d["required_capabilities"])
     t = d["type"]
     if t == "work_task":
         return WorkTask(
@@ -81,7 +96,14 @@ def _task(d: dict) -> WorkTask | SearchTask | MoveTask:
 
 
 def _task_state(d: dict) -> TaskState | SearchTaskState | MoveTaskState:
-    status = TaskStatus(d["status"]) if d["status"] else None
+    status = None
+    if d["status"]:
+        status = _TASK_STATUSES.get(d["status"])
+        if status is None:
+            raise ValueError(
+                f"status {d['status']!r} is not a valid TaskStatus "
+                f"(expected one of {sorted(_TASK_STATUSES)})"
+            )
     completed_at = Time(d["completed_at"]) if d["completed_at"] is not None else None
     t = d["type"]
     if t == "task_state":
@@ -112,7 +134,7 @@ def _task_state(d: dict) -> TaskState | SearchTaskState | MoveTaskState:
 def _robot(d: dict) -> Robot:
     return Robot(
         id=RobotId(d["id"]),
-        capabilities=frozenset(Capability(c) for c in d["capabilities"]),
+        capabilities=capability_set_from_values(d["capabilities"]),
         speed=d["speed"],
         battery_drain_per_unit_of_movement=d["battery_drain_per_unit_of_movement"],
         battery_drain_per_unit_of_work_execution=d["battery_drain_per_unit_of_work_execution"],
@@ -141,12 +163,17 @@ def _rescue_point(d: dict) -> RescuePoint:
 
 def _environment(d: dict) -> Environment:
     env = Environment(width=d["width"], height=d["height"])
-    for obs in d["obstacles"]:
-        env.add_obstacle(_pos(obs))
+    env.add_obstacles(_pos(obs) for obs in d["obstacles"])
     for zone_d in d["zones"].values():
+        zone_type = _ZONE_TYPES.get(zone_d["zone_type"])
+        if zone_type is None:
+            raise ValueError(
+                f"zone_type {zone_d['zone_type']!r} is not a valid ZoneType "
+                f"(expected one of {sorted(_ZONE_TYPES)})"
+            )
         env.add_zone(Zone.from_positions(
             id=ZoneId(zone_d["id"]),
-            zone_type=ZoneType(zone_d["zone_type"]),
+            zone_type=zone_type,
             positions=[_pos(p) for p in zone_d["cells"]],
         ))
     for rp_d in d["rescue_points"].values():
@@ -154,9 +181,9 @@ def _environment(d: dict) -> Environment:
     return env
 
 
-def _state(d: dict) -> SimulationState:
+def _state(d: dict, environment: Environment) -> SimulationState:
     return SimulationState(
-        environment=_environment(d["environment"]),
+        environment=environment,
         robots={RobotId(int(k)): _robot(v) for k, v in d["robots"].items()},
         robot_states={RobotId(int(k)): _robot_state(v) for k, v in d["robot_states"].items()},
         tasks={TaskId(int(k)): _task(v) for k, v in d["tasks"].items()},
@@ -189,14 +216,23 @@ def main() -> None:
     parser.add_argument("--step", action="store_true", help="Press Enter to advance each frame")
     args = parser.parse_args()
 
-    frames = json.loads(args.replay.read_text())
+    frames = json.loads(args.replay.read_bytes())
     view = _make_view(args.viewer)
 
+    # The environment is static over a run, so every frame carries the same
+    # environment dict. Rebuild it only when it actually differs.
+    environment_json: dict | None = None
+    environment: Environment | None = None
+
     try:
         for frame in frames:
             if not view.is_running():
                 break
-            view.render(_state(frame["state"]))
+            state_json = frame["state"]
+            if environment is None or state_json["environment"] != environment_json:
+                environment_json = state_json["environment"]
+                environment = _environment(environment_json)
+            view.render(_state(state_json, environment))
             if args.step:
                 input()
             else: